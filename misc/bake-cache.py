@@ -0,0 +1,26 @@
+"""Bakes the ./data probability tables into a single float32 binary.
+
+Writes ./target/probs.f32.bin holding every table as float32 (256 values per
+table, ~7 KB). probability_tables.load_all memory-maps it when it is newer
+than all of the JSON files, skipping JSON parsing entirely; the baked values
+are bit-identical to what the parse produces, so generator output doesn't
+depend on whether the cache exists. Re-run after changing anything in ./data.
+
+Usage (from the repo root): python3 misc/bake-cache.py
+"""
+
+import numpy as np
+
+from probability_tables import CACHE, NAMES, _parse_all
+
+
+def main():
+    tables = _parse_all()
+    baked = np.stack([tables[name] for name in NAMES])
+    CACHE.parent.mkdir(parents=True, exist_ok=True)
+    baked.tofile(CACHE)
+    print(f"baked {len(NAMES)} tables into {CACHE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Generates the deterministic win-probability table.
+
+Under the deterministic battle model the attacker wins exactly when its stat
+digit is strictly higher than the defender's (ties go to the defender, as in
+the real battle rules), so every probability is 0.0 or 1.0.
+
+Usage (from the repo root): python3 misc/calc-deterministic-probs.py > data/deterministic.json
+"""
+
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # fall back to the stdlib serializer with an orjson-shaped interface
+    import json as _json
+
+    class orjson:
+        dumps = staticmethod(lambda data: _json.dumps(data).encode())
+
+
+def main():
+    wins = np.greater.outer(np.arange(16), np.arange(16)).astype(float)
+    data = {str(at): {str(de): float(wins[at, de]) for de in range(16)} for at in range(16)}
+    sys.stdout.write(orjson.dumps(data).decode())
+
+
+if __name__ == "__main__":
+    main()
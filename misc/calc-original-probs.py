@@ -0,0 +1,42 @@
+"""Generates the win-probability table for the original battle model.
+
+Follows the battle rules in the readme: a stat digit V hides a real value
+uniform in [16V, 16V + 15], each side rolls uniform in [0, real] and keeps
+real - roll (itself uniform in [0, real]), and the higher result wins with
+ties going to the defender. The table averages the exact discrete win
+probability over both hidden real values.
+
+Usage (from the repo root): python3 misc/calc-original-probs.py > data/original.json
+"""
+
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # fall back to the stdlib serializer with an orjson-shaped interface
+    import json as _json
+
+    class orjson:
+        dumps = staticmethod(lambda data: _json.dumps(data).encode())
+
+
+def main():
+    # for real values a, d: P(win) = #{(x, y) : 0 <= x <= a, 0 <= y <= d,
+    # x > y} / ((a + 1)(d + 1)), where #{y < x} per x is min(x, d + 1)
+    reals = np.arange(256)
+    below = np.minimum.outer(reals, reals + 1)
+    pairs = np.cumsum(below, axis=0)
+    wins = pairs / np.multiply.outer(reals + 1, reals + 1)
+
+    # average over the 16 hidden real values behind each digit
+    table = wins.reshape(16, 16, 16, 16).mean(axis=(1, 3))
+
+    data = {str(at): {str(de): float(table[at, de]) for de in range(16)} for at in range(16)}
+    sys.stdout.write(orjson.dumps(data).decode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Generates Rust lookup tables of attacker win probabilities.
+
+Reads the probability tables in ./data and prints one flat [f32; 256] const
+per table. Each table maps (attack stat digit, defense stat digit) to the
+probability that the attacker wins the battle, indexed as attack * 16 +
+defense.
+
+Usage (from the repo root): python3 misc/generate-code.py > probabilities.rs
+"""
+
+import contextlib
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from probability_tables import TABLES, load_all, read_all
+
+CACHE_DIR = Path("./target/codegen-cache")
+
+COMMENTS = [f", // {at:X} v {de:X}" for at in range(16) for de in range(16)]
+
+
+def print_lookup_table(name, table):
+    # format all 256 floats in one C-level pass instead of 256 f-strings
+    values = np.char.mod("%f", table.reshape(256))
+    body = "\n".join(f"    {value}{comment}" for value, comment in zip(values, COMMENTS))
+    print(f"const {name}: [f32; 256] = [\n{body}\n];")
+
+
+def emit(tables):
+    for index, (const, name) in enumerate(TABLES):
+        if index:
+            print()
+        print_lookup_table(const, tables[name])
+
+
+def main():
+    # the output depends on the input tables and on the emit code itself, so
+    # hash both; a stale entry would otherwise survive edits to the generator
+    here = Path(__file__)
+    digest = hashlib.sha256(
+        here.read_bytes()
+        + here.with_name("probability_tables.py").read_bytes()
+        + b"".join(read_all())
+    ).hexdigest()
+    cached = CACHE_DIR / f"generate-code.{digest}.rs"
+    if cached.exists():
+        sys.stdout.write(cached.read_text())
+        return
+
+    tables = load_all()
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        emit(tables)
+    output = buf.getvalue()
+
+    sys.stdout.write(output)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(".tmp")
+    tmp.write_text(output)
+    tmp.replace(cached)  # atomic publish so a killed run can't leave a bad hit
+
+
+if __name__ == "__main__":
+    main()
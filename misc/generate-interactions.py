@@ -0,0 +1,125 @@
+"""Generates the INTERACTIONS lookup table as Rust source.
+
+For every arrows value (0-255) and every board cell (0x0-0xF) the table holds a
+u16 bitset of the cells that a card with those arrows, placed on that cell,
+points at. Bit n of the u16 corresponds to board cell n.
+
+The neighbour list mirrors get_possible_neighbours in src/logic/mod.rs and the
+arrow bits mirror the Arrows constants in src/main.rs.
+
+Usage: python3 misc/generate-interactions.py > interactions.rs
+"""
+
+import functools
+import sys
+
+import numpy as np
+
+# clockwise from the top, same layout as Arrows in src/main.rs
+U = 0b1000_0000
+UR = 0b0100_0000
+R = 0b0010_0000
+DR = 0b0001_0000
+D = 0b0000_1000
+DL = 0b0000_0100
+L = 0b0000_0010
+UL = 0b0000_0001
+
+# cell -> [(neighbouring cell, arrow that points at it)]
+NEIGHBOURS = {
+    0x0: [(0x1, R), (0x5, DR), (0x4, D)],
+    0x1: [(0x2, R), (0x6, DR), (0x5, D), (0x4, DL), (0x0, L)],
+    0x2: [(0x3, R), (0x7, DR), (0x6, D), (0x5, DL), (0x1, L)],
+    0x3: [(0x7, D), (0x6, DL), (0x2, L)],
+    0x4: [(0x0, U), (0x1, UR), (0x5, R), (0x9, DR), (0x8, D)],
+    0x5: [(0x1, U), (0x2, UR), (0x6, R), (0xA, DR), (0x9, D), (0x8, DL), (0x4, L), (0x0, UL)],
+    0x6: [(0x2, U), (0x3, UR), (0x7, R), (0xB, DR), (0xA, D), (0x9, DL), (0x5, L), (0x1, UL)],
+    0x7: [(0x3, U), (0xB, D), (0xA, DL), (0x6, L), (0x2, UL)],
+    0x8: [(0x4, U), (0x5, UR), (0x9, R), (0xD, DR), (0xC, D)],
+    0x9: [(0x5, U), (0x6, UR), (0xA, R), (0xE, DR), (0xD, D), (0xC, DL), (0x8, L), (0x4, UL)],
+    0xA: [(0x6, U), (0x7, UR), (0xB, R), (0xF, DR), (0xE, D), (0xD, DL), (0x9, L), (0x5, UL)],
+    0xB: [(0x7, U), (0xF, D), (0xE, DL), (0xA, L), (0x6, UL)],
+    0xC: [(0x8, U), (0x9, UR), (0xD, R)],
+    0xD: [(0x9, U), (0xA, UR), (0xE, R), (0xC, L), (0x8, UL)],
+    0xE: [(0xA, U), (0xB, UR), (0xF, R), (0xD, L), (0x9, UL)],
+    0xF: [(0xB, U), (0xE, L), (0xA, UL)],
+}
+
+
+# NEIGHBOURS flattened into parallel structure-of-arrays tuples, built once at
+# import so the matrix fill below is a single fancy-indexed assignment
+_CELLS, _NCELLS, _ARROWS = zip(
+    *((cell, neighbour, arrow) for cell, ns in NEIGHBOURS.items() for neighbour, arrow in ns)
+)
+
+
+# the table is pure integer bit ops, so when numba happens to be installed a
+# jitted loop computes it without the broadcast temporaries; the NumPy path
+# below stays as the no-extra-dependency fallback
+try:
+    from numba import njit
+except ImportError:
+    _jit_compute = None
+else:
+
+    @njit(cache=True)
+    def _jit_compute(arrow_to):
+        table = np.zeros((256, 16), dtype=np.uint16)
+        for arrows in range(256):
+            for cell in range(16):
+                interactions = 0
+                for neighbour in range(16):
+                    if arrows & arrow_to[cell, neighbour]:
+                        interactions |= 1 << neighbour
+                table[arrows, cell] = interactions
+        return table
+
+
+def compute_table():
+    # arrow_to[cell, neighbour] is the arrow mask pointing from cell at
+    # neighbour, 0 where the cells aren't adjacent
+    arrow_to = np.zeros((16, 16), dtype=np.uint16)
+    arrow_to[list(_CELLS), list(_NCELLS)] = _ARROWS
+
+    if _jit_compute is not None:
+        return _jit_compute(arrow_to)
+
+    # broadcast all 256 arrows values against every (cell, neighbour) pair at
+    # once instead of looping in Python
+    arrows = np.arange(256, dtype=np.uint16)[:, None, None]
+    hit = (arrows & arrow_to[None, :, :]) != 0
+    bits = hit.astype(np.uint16) << np.arange(16, dtype=np.uint16)[None, None, :]
+    # each neighbour owns a unique bit so a sum is equivalent to an OR
+    return bits.sum(axis=2, dtype=np.uint16)
+
+
+# at most 4096 distinct u16 values appear, so memoize the rendered entry per
+# value instead of re-parsing a four-field format spec every time
+@functools.cache
+def format_entry(value):
+    bits = format(value, "016b")
+    return f"        0b{bits[:4]}_{bits[4:8]}_{bits[8:12]}_{bits[12:]},"
+
+
+def main():
+    table = compute_table()
+
+    # buffer the ~4900 output lines and write them in one go instead of paying
+    # a print call (and possible flush) per line
+    out = []
+    # all 256 comment lines formatted up front, outside the emit loop
+    labels = [f"    // Arrows: {a >> 4:04b}_{a & 0b1111:04b}" for a in range(256)]
+    out.append("const INTERACTIONS: [[u16; 16]; 256] = [")
+    for arrows in range(256):
+        out.append(labels[arrows])
+        out.append("    [")
+        for cell in range(16):
+            out.append(format_entry(int(table[arrows, cell])))
+        out.append("    ],")
+    out.append("];")
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+
+if __name__ == "__main__":
+    main()
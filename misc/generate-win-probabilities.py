@@ -0,0 +1,65 @@
+"""Generates Rust lookup tables of attacker win probabilities, nested layout.
+
+Same data as misc/generate-code.py but prints one [[f32; 16]; 16] const per
+table, indexed as [attack][defense].
+
+Usage (from the repo root): python3 misc/generate-win-probabilities.py
+"""
+
+import contextlib
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from probability_tables import TABLES, load_all, read_all
+
+CACHE_DIR = Path("./target/codegen-cache")
+
+
+def print_lookup_table(name, table):
+    # format all 256 floats in one C-level pass instead of 256 f-strings
+    values = np.char.mod("%f", table)
+    rows = "\n".join(f"    [{', '.join(row)}], // attack {at:X}" for at, row in enumerate(values))
+    print(f"const {name}: [[f32; 16]; 16] = [\n{rows}\n];")
+
+
+def emit(tables):
+    for index, (const, name) in enumerate(TABLES):
+        if index:
+            print()
+        print_lookup_table(const, tables[name])
+
+
+def main():
+    # the output depends on the input tables and on the emit code itself, so
+    # hash both; a stale entry would otherwise survive edits to the generator
+    here = Path(__file__)
+    digest = hashlib.sha256(
+        here.read_bytes()
+        + here.with_name("probability_tables.py").read_bytes()
+        + b"".join(read_all())
+    ).hexdigest()
+    cached = CACHE_DIR / f"generate-win-probabilities.{digest}.rs"
+    if cached.exists():
+        sys.stdout.write(cached.read_text())
+        return
+
+    tables = load_all()
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        emit(tables)
+    output = buf.getvalue()
+
+    sys.stdout.write(output)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(".tmp")
+    tmp.write_text(output)
+    tmp.replace(cached)  # atomic publish so a killed run can't leave a bad hit
+
+
+if __name__ == "__main__":
+    main()
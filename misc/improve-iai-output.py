@@ -0,0 +1,73 @@
+"""Post-processes `cargo bench` output from the iai benchmark harness.
+
+Echoes the bench output and appends the percentage change of every metric
+against the previous run, which is stashed in ./target/iai-previous.json.
+iai only compares against the immediately preceding run inside cargo's own
+bookkeeping; keeping our own copy survives `cargo clean` of the bench
+artifacts and works across branches.
+
+Usage: cargo bench | python3 misc/improve-iai-output.py
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+PREVIOUS = Path("./target/iai-previous.json")
+
+KEYS = {
+    "Instructions": "instructions",
+    "L1 Accesses": "l1-accesses",
+    "L2 Accesses": "l2-accesses",
+    "RAM Accesses": "ram-accesses",
+    "Estimated Cycles": "estimated-cycles",
+}
+
+# one multiline scan over the whole input: unindented non-blank lines are
+# benchmark names, indented "<metric>: <n>" lines are the values to annotate;
+# iai appends its own "(+x.x%)" delta after the first run, so allow (and
+# keep) a trailing parenthesized suffix
+PATTERN = re.compile(
+    r"^(?P<name>\S.*)$"
+    r"|^\s+(?P<metric>Instructions|L[12] Accesses|RAM Accesses|Estimated Cycles):"
+    r"\s+(?P<value>\d+)(?:\s+\([^)]*\))?$",
+    re.M,
+)
+
+
+def main():
+    src = sys.stdin.read()
+    previous = json.loads(PREVIOUS.read_text()) if PREVIOUS.exists() else {}
+    current = {}
+    name = None
+
+    def annotate(match):
+        nonlocal name
+        line = match[0]
+        metric = match["metric"]
+        if metric is None:
+            name = match["name"]
+            current[name] = {}
+            return line
+
+        key = KEYS[metric]
+        value = int(match["value"])
+        current[name][key] = value
+
+        old = previous.get(name, {}).get(key)
+        if old:
+            return f"{line} ({(value - old) / old:+.2%})"
+        return line
+
+    sys.stdout.write(PATTERN.sub(annotate, src))
+
+    # only replace the stash when something was actually parsed, so a bad or
+    # empty input can't wipe the previous run's numbers
+    if any(current.values()):
+        PREVIOUS.parent.mkdir(parents=True, exist_ok=True)
+        PREVIOUS.write_text(json.dumps(current))
+
+
+if __name__ == "__main__":
+    main()
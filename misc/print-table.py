@@ -0,0 +1,96 @@
+"""Prints a win-probability table as a colored 16x16 grid.
+
+Reads either one of the JSON tables in ./data or a CSV exported from
+anydice.com and prints the attacker win percentage for every attack/defense
+stat digit pair. Rows are the attack digit, columns the defense digit.
+
+Usage (from the repo root): python3 misc/print-table.py data/original.json
+                            python3 misc/print-table.py anydice-export.csv
+"""
+
+import csv
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from colorama import Fore
+
+
+def load_json(path):
+    table = json.loads(Path(path).read_text())
+    # resolve the str-keyed dicts once so the print loop indexes by int
+    return [float(table[str(at)][str(de)]) for at in range(16) for de in range(16)]
+
+
+def load_anydice(path):
+    # anydice CSVs hold "A v D",percentage rows, grouped by attack digit
+    data = defaultdict(dict)
+    group_at = None
+    group = None
+    # newline="" hands line splitting to the csv module in one pass instead
+    # of paying universal-newline translation first
+    with open(path, newline="") as fp:
+        for row in csv.reader(fp):
+            if len(row) < 2:
+                continue
+            at, sep, de = row[0].partition(" v ")
+            if not sep:
+                continue
+            if at != group_at:
+                group_at = at
+                group = data[at]
+            group[de] = float(row[1]) / 100
+    return [data[str(at)][str(de)] for at in range(16) for de in range(16)]
+
+
+# bind the colorama attributes once instead of re-resolving Fore.* per use
+_GREEN, _BLUE, _YELLOW, _RED, _RESET = Fore.GREEN, Fore.BLUE, Fore.YELLOW, Fore.RED, Fore.RESET
+
+# every possible cell rendering, precomputed once so the print loop does a
+# list index instead of four comparisons and three concats per cell
+COLORED = [
+    (_GREEN if perc >= 75 else _BLUE if perc >= 50 else _YELLOW if perc >= 25 else _RED)
+    + f"{perc:3d}"
+    + _RESET
+    for perc in range(101)
+]
+
+
+def datum(table, at, de):
+    return COLORED[round(table[at * 16 + de] * 100)]
+
+
+def _build_template():
+    # the whole frame as one string with {r<at>_<de>} cell placeholders, so
+    # print_table is a single format_map + a single write
+    lines = [
+        "┏━━━┳" + "┯".join(["━━━━━"] * 16) + "┓",
+        "┃   ┃" + "│".join(f"  {de:X}  " for de in range(16)) + "┃",
+        "┣━━━╋" + "┿".join(["━━━━━"] * 16) + "┫",
+    ]
+    for at in range(16):
+        lines.append(f"┃ {at:X} ┃" + "│".join(f" {{r{at}_{de}}} " for de in range(16)) + "┃")
+        if at < 15:
+            lines.append("┠───╂" + "┼".join(["─────"] * 16) + "┨")
+    lines.append("┗━━━┻" + "┷".join(["━━━━━"] * 16) + "┛")
+    lines.append("")
+    return "\n".join(lines)
+
+
+TEMPLATE = _build_template()
+
+
+def print_table(table):
+    cells = {f"r{at}_{de}": datum(table, at, de) for at in range(16) for de in range(16)}
+    sys.stdout.write(TEMPLATE.format_map(cells))
+
+
+def main():
+    path = sys.argv[1]
+    table = load_anydice(path) if path.endswith(".csv") else load_json(path)
+    print_table(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Shared loader for the win-probability tables in ./data.
+
+generate-code.py and generate-win-probabilities.py emit the same tables in
+different layouts; importing this module lets them share a single read and
+parse pass. Tables are exposed as (16, 16) float32 arrays indexed by
+[attack][defense].
+"""
+
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # fall back to the stdlib parser with an orjson-shaped interface
+    import json as _json
+
+    class orjson:
+        loads = staticmethod(lambda data: _json.loads(data.decode()))
+
+DATA_DIR = Path("./data")
+
+# every table the generators know about, in emit order; the dice tables come
+# from anydice.com exports and may not be present in a checkout, so only the
+# files that actually exist in ./data are loaded
+_KNOWN = ["deterministic", "original", "dice-4", "dice-6", "dice-8", "dice-10", "dice-12"]
+NAMES = [name for name in _KNOWN if (DATA_DIR / f"{name}.json").exists()]
+
+# (Rust const name, table name) pairs in emit order
+TABLES = [("PROBS_" + name.upper().replace("-", "_"), name) for name in NAMES]
+
+# baked binary of all tables as float32, written by bake-cache.py
+CACHE = Path("./target/probs.f32.bin")
+
+
+@functools.cache
+def read_all():
+    """Raw bytes of every table file, in NAMES order."""
+    paths = [DATA_DIR / f"{name}.json" for name in NAMES]
+    if not paths:
+        sys.exit(f"no probability tables found in {DATA_DIR} -- run from the repo root")
+    # the reads are independent and block in read(2), so overlap them
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return tuple(executor.map(Path.read_bytes, paths))
+
+
+def _cache_fresh():
+    if not CACHE.exists():
+        return False
+    baked = CACHE.stat()
+    # the binary survives branch switches, so also require that it was baked
+    # from the same number of tables as this checkout has; a size mismatch
+    # falls back to the JSON parse instead of failing the reshape
+    if baked.st_size != len(NAMES) * 256 * 4:
+        return False
+    return all((DATA_DIR / f"{name}.json").stat().st_mtime <= baked.st_mtime for name in NAMES)
+
+
+def _parse_all():
+    # parsing is serial on purpose: orjson holds the GIL during loads, so a
+    # thread pool here would only add overhead
+    tables = {}
+    for name, blob in zip(NAMES, read_all()):
+        table = orjson.loads(blob)
+        tables[name] = np.asarray(
+            [[float(table[str(at)][str(de)]) for de in range(16)] for at in range(16)],
+            dtype=np.float32,
+        )
+    return tables
+
+
+@functools.cache
+def load_all():
+    """name -> (16, 16) float32 array of attacker win probabilities."""
+    # prefer the baked binary: a mapped ~7 KB read instead of any JSON
+    # parsing, holding the same float32 values the parse produces so the
+    # loaded tables (and everything emitted from them) are bit-identical
+    if _cache_fresh():
+        raw = np.memmap(CACHE, dtype=np.float32, mode="r")
+        arrays = np.asarray(raw).reshape(len(NAMES), 16, 16)
+        return dict(zip(NAMES, arrays))
+    return _parse_all()